@@ -6,8 +6,14 @@ Provides keywords for interacting with tables/lists rendered as Windows UI
 Automation elements, typically with Header/HeaderItem and ListItem/Text structure.
 """
 
+import re
+from itertools import chain, repeat
+
 from .keywordgroup import KeywordGroup
 
+# Click types understood by _perform_click
+_VALID_BUTTONS = frozenset(("left", "right", "double"))
+
 
 class _TableKeywords(KeywordGroup):
     """Keywords for table/list operations in Windows automation."""
@@ -266,27 +272,7 @@ class _TableKeywords(KeywordGroup):
                 table_locator=table_locator, **kwargs
             )
 
-        if not table_data or len(table_data) <= 1:
-            return []
-
-        headers = table_data[0]
-
-        if col_name is not None:
-            try:
-                col_index = headers.index(col_name)
-            except ValueError:
-                return []
-        elif col_index is not None:
-            col_index = int(col_index)
-        else:
-            return []
-
-        column_values = []
-        for row in table_data[1:]:
-            if col_index < len(row):
-                column_values.append(row[col_index])
-
-        return column_values
+        return list(self._iter_table_column(table_data, col_name, col_index))
 
     def get_table_dimensions(
         self,
@@ -521,14 +507,18 @@ class _TableKeywords(KeywordGroup):
         if not table_data or len(table_data) <= 1:
             return []
 
-        if not case_sensitive:
-            search_term = search_term.lower()
+        pattern = re.compile(
+            re.escape(search_term), 0 if case_sensitive else re.IGNORECASE
+        )
 
         results = []
         for row_idx, row in enumerate(table_data[1:]):
+            # Scan the whole row once and only look at its cells on a hit.
+            # Cells are joined with the unit separator so a match cannot span two cells.
+            if not pattern.search("\x1f".join(row)):
+                continue
             for col_idx, cell in enumerate(row):
-                cell_to_search = cell if case_sensitive else cell.lower()
-                if search_term in cell_to_search:
+                if pattern.search(cell):
                     results.append((row_idx, col_idx, cell))
 
         return results
@@ -628,23 +618,17 @@ class _TableKeywords(KeywordGroup):
         | @{expected}= | Create List   | file1.txt | file2.txt |
         | ${result}=   | Verify Table Column Values | Name | ${expected} | table_locator=//Table |
         """
-        actual_values = self.get_table_column(
-            col_name=col_name, table_data=table_data,
-            table_locator=table_locator, **kwargs
-        )
+        # col_index is a get_table_column argument, not a get_table_data one
+        col_index = kwargs.pop("col_index", None)
+        if table_data is None:
+            table_data = self.get_table_data(
+                table_locator=table_locator, **kwargs
+            )
 
-        if ordered:
-            if len(actual_values) != len(expected_values):
-                return False
-            return actual_values == expected_values
-        else:
-            if exact_match:
-                return set(expected_values).issubset(set(actual_values))
-            else:
-                for expected in expected_values:
-                    if not any(expected in actual for actual in actual_values):
-                        return False
-                return True
+        return self._column_matches(
+            self._iter_table_column(table_data, col_name, col_index),
+            expected_values, exact_match, ordered
+        )
 
     def verify_table_sort_order(
         self,
@@ -677,15 +661,13 @@ class _TableKeywords(KeywordGroup):
         if not column_values:
             return True
 
-        if case_sensitive:
-            sorted_values = sorted(column_values)
-        else:
-            sorted_values = sorted(column_values, key=str.lower)
+        if not case_sensitive:
+            column_values = [value.lower() for value in column_values]
 
+        pairs = zip(column_values, column_values[1:])
         if order.upper() == "DESC":
-            sorted_values.reverse()
-
-        return column_values == sorted_values
+            return all(a >= b for a, b in pairs)
+        return all(a <= b for a, b in pairs)
 
     # =============================================================================
     # Conversion
@@ -718,16 +700,11 @@ class _TableKeywords(KeywordGroup):
             return []
 
         headers = table_data[0]
-        result = []
-
-        for row in table_data[1:]:
-            row_dict = {}
-            for idx, header in enumerate(headers):
-                value = row[idx] if idx < len(row) else ""
-                row_dict[header] = value
-            result.append(row_dict)
-
-        return result
+        # Rows shorter than the header are padded with "" for missing cells
+        return [
+            dict(zip(headers, chain(row, repeat(""))))
+            for row in table_data[1:]
+        ]
 
     def get_table_value_from_row(
         self,
@@ -783,8 +760,6 @@ class _TableKeywords(KeywordGroup):
 
         return None
 
-
-
     # =============================================================================
     # Interaction
     # =============================================================================
@@ -908,7 +883,7 @@ class _TableKeywords(KeywordGroup):
         | Click Table Row | row_index=0 | table_locator=//Table |
         | Click Table Row | col_name=Name | col_value=file1.txt | button=double | table_locator=//Table |
         """
-        if button not in ("left", "right", "double"):
+        if button not in _VALID_BUTTONS:
             raise ValueError(
                 f"Invalid button type: {button}. Must be 'left', 'right', or 'double'"
             )
@@ -955,7 +930,7 @@ class _TableKeywords(KeywordGroup):
         row_index = int(row_index)
         col_index = int(col_index)
 
-        if button not in ("left", "right", "double"):
+        if button not in _VALID_BUTTONS:
             raise ValueError(
                 f"Invalid button type: {button}. Must be 'left', 'right', or 'double'"
             )
@@ -1079,3 +1054,57 @@ class _TableKeywords(KeywordGroup):
             self.appium_action_context_click(element)
         elif button == "double":
             self.appium_action_double_click(element)
+
+    def _iter_table_column(self, table_data, col_name=None, col_index=None):
+        """Yield the values of one column (excluding the header).
+
+        The column is given by ``col_name`` (header value) or ``col_index``
+        (0-based). Yields nothing if the table is empty or the column is unknown;
+        rows too short to have the column are skipped.
+        """
+        if not table_data or len(table_data) <= 1:
+            return
+
+        if col_name is not None:
+            try:
+                col_index = table_data[0].index(col_name)
+            except ValueError:
+                return
+        elif col_index is not None:
+            col_index = int(col_index)
+        else:
+            return
+
+        for row in table_data[1:]:
+            if col_index < len(row):
+                yield row[col_index]
+
+    def _column_matches(self, actual_values, expected_values, exact_match, ordered):
+        """Compare streamed column values with ``expected_values`` in one pass.
+
+        Stops at the first mismatch (ordered) or as soon as every expected
+        value has been seen (unordered).
+        """
+        if ordered:
+            expected_values = list(expected_values)
+            count = 0
+            for actual in actual_values:
+                if count >= len(expected_values) or actual != expected_values[count]:
+                    return False
+                count += 1
+            return count == len(expected_values)
+
+        if exact_match:
+            remaining = set(expected_values)
+            for actual in actual_values:
+                if not remaining:
+                    break
+                remaining.discard(actual)
+            return not remaining
+
+        remaining = list(expected_values)
+        for actual in actual_values:
+            if not remaining:
+                break
+            remaining = [expected for expected in remaining if expected not in actual]
+        return not remaining
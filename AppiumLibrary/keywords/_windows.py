@@ -1,12 +1,15 @@
 import time
 import os
-import pathlib
 import re
 import ntpath
 import posixpath
+from functools import lru_cache
 
 from AppiumLibrary.keywords.keywordgroup import KeywordGroup
 
+# A single backtick that is not already part of an escaped pair
+_SINGLE_BACKTICK = re.compile(r"(?<!`)`(?!`)")
+
 
 class _WindowsKeywords(KeywordGroup):
 
@@ -193,7 +196,7 @@ class _WindowsKeywords(KeywordGroup):
         - Replaces initial ``~`` or ``~user`` by that user's home directory.
         - If ``case_normalize`` is given a true value (see `Boolean arguments`)
           on Windows, converts the path to all lowercase.
-        - Converts ``pathlib.Path`` instances to ``str``.
+        - Converts path-like objects such as ``pathlib.Path`` to ``str``.
 
         Examples:
         | ${path1} = | Appium Normalize Path | abc/           |
@@ -207,35 +210,12 @@ class _WindowsKeywords(KeywordGroup):
         - ${path4} = ``\\home\\robot\\stuff``
 
         """
-        # Determine strict library to use based on target separator
-        if sep == "\\":
-            path_module = ntpath
-        else:
-            path_module = posixpath
-
-        if isinstance(path, pathlib.Path):
-            path = str(path)
-
-        path = path or "."
-        path = os.path.expanduser(path)
-
-        # If targeting Posix, ensure backslashes are converted to forward slashes 
-        # BEFORE normalization, because posixpath treats backslash as a filename character.
-        if path_module is posixpath:
-            path = path.replace("\\", "/")
-
-        path = path_module.normpath(path)
-
-        if case_normalize:
-            path = path_module.normcase(path)
-
-        if escape_backtick:
-            path = re.sub(r"(?<!`)`(?!`)", "``", path)
-
-        # Force final separator just in case, though normpath usually handles it.
-        # ntpath produces '\', posixpath produces '/'
-        # The original code did a final cleaning, we can preserve rstrip.
-        return path.rstrip()
+        if not path:
+            return "."
+        path = os.fspath(path)
+        if path.startswith("~"):
+            path = os.path.expanduser(path)
+        return _normalize_remote_path(path, sep, case_normalize, escape_backtick)
 
     # Private
     def _apply_modifier_keys(self, params: dict, kwargs: dict):
@@ -455,3 +435,36 @@ class _WindowsKeywords(KeywordGroup):
         self._current_application().execute_script("windows: keys", {"actions": actions})
         sleep = kwargs.pop("sleep", kwargs.pop("post_delay", 0.5))
         time.sleep(float(sleep))
+
+
+@lru_cache(maxsize=4096)
+def _normalize_remote_path(path, sep, case_normalize, escape_backtick):
+    """Cached implementation of `Appium Normalize Path` for a ``str`` path."""
+    # Determine strict library to use based on target separator
+    if sep == "\\":
+        path_module = ntpath
+    else:
+        path_module = posixpath
+
+    # If targeting Posix, ensure backslashes are converted to forward slashes 
+    # BEFORE normalization, because posixpath treats backslash as a filename character.
+    if path_module is posixpath:
+        path = path.replace("\\", "/")
+
+    path = path_module.normpath(path)
+
+    if case_normalize:
+        path = path_module.normcase(path)
+
+    # Only pay for the regex when there is a backtick to escape; with no
+    # escaped pair present every backtick is single and a plain replace suffices
+    if escape_backtick and "`" in path:
+        if "``" in path:
+            path = _SINGLE_BACKTICK.sub("``", path)
+        else:
+            path = path.replace("`", "``")
+
+    # Force final separator just in case, though normpath usually handles it.
+    # ntpath produces '\', posixpath produces '/'
+    # The original code did a final cleaning, we can preserve rstrip.
+    return path.rstrip()
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
-import inspect
 import functools
+from types import FunctionType
 
 # Internal/private marker attribute name
 _RUN_ON_FAILURE_MARKER = "__rof_processed__"
@@ -12,16 +12,18 @@ def _run_on_failure_decorator(method):
         # Already decorated or ignored → skip re-wrapping
         return method
 
+    # Keywords are always plain functions called as bound methods, so self is
+    # taken positionally. _run_on_failure usually lives on a sibling mixin and
+    # is only resolved once a keyword actually fails.
     @functools.wraps(method)
-    def wrapper(*args, **kwargs):
+    def wrapper(self, *args, **kwargs):
         try:
-            return method(*args, **kwargs)
+            return method(self, *args, **kwargs)
         except Exception as err:
-            self = args[0] if args else None
-            if self and hasattr(self, "_run_on_failure"):
-                if not getattr(err, "_run_on_failure_executed", False):
-                    self._run_on_failure()
-                    err._run_on_failure_executed = True
+            run_on_failure = getattr(self, "_run_on_failure", None)
+            if run_on_failure is not None and not getattr(err, "_run_on_failure_executed", False):
+                run_on_failure()
+                err._run_on_failure_executed = True
             raise
 
     setattr(wrapper, _RUN_ON_FAILURE_MARKER, True)      # mark as decorated
@@ -39,14 +41,17 @@ class KeywordGroupMetaClass(type):
         for name, method in list(attrs.items()):
             if (
                 not name.startswith('_')
-                and inspect.isfunction(method)
-                and not getattr(method, _RUN_ON_FAILURE_MARKER, False)
+                and type(method) is FunctionType
+                and not method.__dict__.get(_RUN_ON_FAILURE_MARKER, False)
             ):
                 attrs[name] = _run_on_failure_decorator(method)
         return super().__new__(cls, clsname, bases, attrs)
 
 
 class KeywordGroup(metaclass=KeywordGroupMetaClass):
+    # No per-instance state here; lets slotted subclasses stay __dict__-free
+    __slots__ = ()
+
     def _invoke_original(self, method, *args, **kwargs):
         """
         Call the original (undecorated) implementation of a method.
@@ -59,13 +64,25 @@ class KeywordGroup(metaclass=KeywordGroupMetaClass):
         Returns None if method not found at all.
         """
         if isinstance(method, str):
-            method = getattr(self, method, None)
+            return self._invoke_original_by_name(method, *args, **kwargs)
+        return self._call_original(method, *args, **kwargs)
+
+    def _invoke_original_by_name(self, name, *args, **kwargs):
+        """
+        Same as `_invoke_original` for callers that pass a method name,
+        e.g. self._invoke_original_by_name("click", el)
+        """
+        return self._call_original(getattr(self, name, None), *args, **kwargs)
+
+    def _call_original(self, method, *args, **kwargs):
+        """Call ``method``'s undecorated function, or ``method`` itself if undecorated."""
         if method is None:
             return None
 
-        if hasattr(method, "__wrapped__"):
+        original = getattr(method, "__wrapped__", None)
+        if original is not None:
             # It's a decorated method (function), so we must pass self
-            return method.__wrapped__(self, *args, **kwargs)
+            return original(self, *args, **kwargs)
 
         # It's an undecorated bound method, so self is already bound
         return method(*args, **kwargs)
@@ -0,0 +1,151 @@
+"""Stand-in modules for Robot Framework, Selenium and Appium.
+
+``install()`` registers the mocks in ``sys.modules`` so that
+``AppiumLibrary.keywords._element`` can be imported without the real
+dependencies. It runs at most once per test process; ``uninstall()`` removes
+everything it registered.
+"""
+import sys
+import types
+
+
+# We do NOT mock "AppiumLibrary" itself because we want to load the real "AppiumLibrary.keywords._element" module
+# However, we DO want to mock "AppiumLibrary.locators" to avoid dependency issues.
+_NAMES = (
+    "robot", "robot.libraries", "robot.libraries.BuiltIn", "robot.utils", "robot.api",
+    "selenium", "selenium.common", "selenium.webdriver", "selenium.webdriver.remote",
+    "selenium.webdriver.remote.webelement",
+    "appium", "appium.webdriver", "appium.options", "appium.options.common",
+    "appium.webdriver.common", "appium.webdriver.common.appiumby", "appium.webdriver.mobilecommand",
+    "AppiumLibrary.locators",
+)
+
+MOCK_MODULES = {name: types.ModuleType(name) for name in _NAMES}
+
+
+# Robot
+class _FakeLogger:
+    @staticmethod
+    def write(*args, **kwargs):
+        pass
+
+    info = debug = warn = error = console = write
+
+
+class _FakeConnectionCache:
+    pass
+
+
+def _fake_timestr_to_secs(timestr, *args, **kwargs):
+    return 1.0
+
+
+def _fake_abspath(path, *args, **kwargs):
+    return "/mock/path"
+
+
+# Create BuiltIn class mock
+class MockBuiltIn:
+    def get_variable_value(self, name, default=None):
+        return default
+
+    def log(self, *args):
+        pass
+
+
+# Selenium
+class MockKeys:
+    def __init__(self):
+        self._cache = {}
+
+    def __getattr__(self, name):
+        cache = self._cache
+        value = cache.get(name)
+        if value is None:
+            value = cache[name] = f"{{{{ {name} }}}}"
+        return value
+
+
+class MockWebElement:
+    def __init__(self, name="mock_element"):
+        self.name = name
+
+    def __repr__(self):
+        return f"<MockWebElement {self.name}>"
+
+
+# Appium
+class _FakeAppiumOptions:
+    pass
+
+
+class _FakeAppiumBy:
+    pass
+
+
+class _FakeMobileCommand:
+    pass
+
+
+# AppiumLibrary
+class MockElementFinder:
+    """Finder whose ``find`` returns ``result``; tests assign it directly."""
+
+    def __init__(self):
+        self.result = []
+
+    def find(self, application, locator, tag):
+        return self.result
+
+
+_ATTRIBUTES = {
+    "robot.api": {"logger": _FakeLogger},
+    "robot.libraries.BuiltIn": {"BuiltIn": MockBuiltIn, "RobotNotRunningError": Exception},
+    "robot.utils": {
+        "timestr_to_secs": _fake_timestr_to_secs,
+        "abspath": _fake_abspath,
+        "ConnectionCache": _FakeConnectionCache,
+    },
+    "selenium.common": {
+        "StaleElementReferenceException": Exception,
+        "NoSuchElementException": Exception,
+        "WebDriverException": Exception,
+        "InvalidArgumentException": Exception,
+    },
+    "selenium.webdriver": {"Keys": MockKeys()},
+    "selenium.webdriver.remote.webelement": {"WebElement": MockWebElement},
+    "appium.options.common": {"AppiumOptions": _FakeAppiumOptions},
+    "appium.webdriver.common.appiumby": {"AppiumBy": _FakeAppiumBy},
+    "appium.webdriver.mobilecommand": {"MobileCommand": _FakeMobileCommand},
+    "AppiumLibrary.locators": {"ElementFinder": MockElementFinder},
+}
+
+for _name, _attrs in _ATTRIBUTES.items():
+    vars(MOCK_MODULES[_name]).update(_attrs)
+
+_installed = False
+
+
+def install():
+    """Register the mock modules in ``sys.modules`` (once per process)."""
+    global _installed
+    if _installed:
+        return
+    for name, module in MOCK_MODULES.items():
+        # Keep modules that are already loaded (real ones or a previous run's mocks)
+        sys.modules.setdefault(name, module)
+    # Wire every submodule onto its installed parent, but never touch real modules
+    for name in MOCK_MODULES:
+        parent_name, _, attr = name.rpartition(".")
+        if MOCK_MODULES.get(parent_name) is sys.modules.get(parent_name, False):
+            setattr(sys.modules[parent_name], attr, sys.modules[name])
+    _installed = True
+
+
+def uninstall():
+    """Remove the mock modules registered by ``install()``."""
+    global _installed
+    for name, module in MOCK_MODULES.items():
+        if sys.modules.get(name) is module:
+            del sys.modules[name]
+    _installed = False
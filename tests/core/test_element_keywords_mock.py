@@ -2,20 +2,24 @@
 import unittest
 import sys
 import os
+import types
 sys.path.append(os.getcwd())
 from unittest.mock import MagicMock, patch, call
 
-from AppiumLibrary.keywords._element import _ElementKeywords
 
 class MockWebElement:
+    __slots__ = ("name", "_text", "_displayed", "_enabled")
+
+    # Geometry is identical for every mock element and read-only
+    location = types.MappingProxyType({'x': 0, 'y': 0})
+    size = types.MappingProxyType({'width': 100, 'height': 100})
+    rect = types.MappingProxyType({**location, **size})
+
     def __init__(self, name="mock_element", text="mock_text", displayed=True, enabled=True):
         self.name = name
         self._text = text
         self._displayed = displayed
         self._enabled = enabled
-        self.location = {'x': 0, 'y': 0}
-        self.size = {'width': 100, 'height': 100}
-        self.rect = {'x': 0, 'y': 0, 'width': 100, 'height': 100}
 
     @property
     def text(self):
@@ -46,53 +50,91 @@ class MockWebElement:
     def __repr__(self):
         return f"<MockWebElement {self.name}>"
 
+class _FinderStub:
+    """Element finder whose ``find`` returns ``result``; tests assign it directly."""
+    __slots__ = ("result",)
+
+    def __init__(self):
+        self.result = []
+
+    def find(self, application, locator, tag):
+        return self.result
+
+class _FakeApp:
+    """Current application stand-in; only the keyboard calls that tests assert on are mocks."""
+    page_source = "<html>source</html>"
+
+    def __init__(self):
+        self.hide_keyboard = MagicMock()
+        self.is_keyboard_shown = MagicMock()
+
+    def execute_script(self, script, *args):
+        pass
+
 class TestElementKeywordsMock(unittest.TestCase):
 
-    def setUp(self):
-        self.ek = _ElementKeywords()
-        self.ek._sleep_between_wait = 0.1
-        self.ek._timeout_in_secs = 5
-        self.ek._log_level = 'DEBUG'
-        self.ek._run_on_failure_keyword = 'Capture Page Screenshot'
-        self.ek._element_finder = MagicMock()
-        
-        mock_app = MagicMock()
-        mock_app.page_source = "<html>source</html>"
-        self.ek._current_application = MagicMock(return_value=mock_app)
-        
-        self.ek._get_platform = MagicMock(return_value='android')
-        
-        self.ek._invoke_original = MagicMock(side_effect=self._invoke_original_passthrough)
-        
-        self.ek._info = MagicMock()
-        self.ek._debug = MagicMock()
-        self.ek._warn = MagicMock()
-        
+    @classmethod
+    def setUpClass(cls):
+        # Import the library lazily so collecting other test modules does not load it
+        from AppiumLibrary.keywords._element import _ElementKeywords
+        cls._ElementKeywords = _ElementKeywords
+
+        # Build the keyword rig once; setUp only resets per-test state
+        cls.ek = cls._ElementKeywords()
+        cls.ek._sleep_between_wait = 0.1
+        cls.ek._timeout_in_secs = 5
+        cls.ek._log_level = 'DEBUG'
+        cls.ek._run_on_failure_keyword = 'Capture Page Screenshot'
+        cls.ek._element_finder = _FinderStub()
+
+        cls.mock_app = app = _FakeApp()
+        cls.ek._current_application = lambda: app
+
+        cls.ek._get_platform = MagicMock(return_value='android')
+
+        cls.ek._invoke_original = cls._invoke_original_passthrough
+
+        cls.ek._info = MagicMock()
+        cls.ek._debug = MagicMock()
+        cls.ek._warn = MagicMock()
+
         # Mock get_source which is expected to exist (mixin)
-        self.ek.get_source = MagicMock(return_value="<html>source</html>")
-        self.ek.log_source = MagicMock()
-        
-        self.mock_element = MockWebElement("default_mock")
+        cls.ek.get_source = MagicMock(return_value="<html>source</html>")
+        cls.ek.log_source = MagicMock()
+
+        cls.mock_element = MockWebElement("default_mock")
+
+    def setUp(self):
+        ek = self.ek
+        for mock in (ek._get_platform, ek._info, ek._debug, ek._warn, ek.get_source, ek.log_source,
+                     self.mock_app.hide_keyboard, self.mock_app.is_keyboard_shown):
+            mock.reset_mock()
+        ek.get_source.return_value = "<html>source</html>"
+        ek._context = {}
+
+        self.mock_element._text = "mock_text"
+        self.mock_element._displayed = True
+        self.mock_element._enabled = True
         # Default behavior: return our standard mock element
-        self.ek._element_finder.find.return_value = [self.mock_element]
+        ek._element_finder.result = [self.mock_element]
 
-    def _invoke_original_passthrough(self, method_name, *args, **kwargs):
-        if hasattr(self.ek, method_name):
-            method = getattr(self.ek, method_name)
-            return method(*args, **kwargs)
-        return None
+    @classmethod
+    def _invoke_original_passthrough(cls, method_name, *args, **kwargs):
+        # Resolve on every call so keywords replaced on the instance are honoured
+        method = getattr(cls.ek, method_name, None)
+        return method(*args, **kwargs) if method is not None else None
 
     # ====================================================================
     # 1. TEST CHECK / EXIST KEYWORDS
     # ====================================================================
     
     def test_appium_element_exist_true(self):
-        self.ek._element_finder.find.return_value = [self.mock_element]
+        self.ek._element_finder.result = [self.mock_element]
         result = self.ek.appium_element_exist("id=foo")
         self.assertTrue(result)
         
     def test_appium_element_exist_false(self):
-        self.ek._element_finder.find.return_value = []
+        self.ek._element_finder.result = []
         result = self.ek.appium_element_exist("id=fail", timeout="0.1s")
         self.assertFalse(result)
 
@@ -101,24 +143,44 @@ class TestElementKeywordsMock(unittest.TestCase):
         self.assertTrue(self.ek.appium_wait_until_element_is_visible("id=visible"))
 
     def test_appium_wait_until_element_is_visible_fail(self):
-        self.ek._element_finder.find.return_value = []
+        self.ek._element_finder.result = []
         self.assertFalse(self.ek.appium_wait_until_element_is_visible("id=timeout", timeout="0.1s"))
 
     # ====================================================================
     # 2. TEST GET KEYWORDS
     # ====================================================================
 
-    def test_appium_get_element_success(self):
-        el = self.ek.appium_get_element("id=ok")
-        self.assertEqual(el, self.mock_element)
+    def test_get_keywords_return_values(self):
+        # Keywords that only look up the default mock element and return it (or one of its values)
+        el = self.mock_element
+        cases = [
+            ("appium_get_element", ("id=ok",), el),
+            ("appium_get_element_by", ("name", "val"), el),
+            ("appium_get_element_in_element", ("parent", "child"), el),
+            # Allow generic match
+            ("appium_get_button_element", ("mock_text",), el),
+            ("get_webelement", ("id=foo",), el),
+            # Default first_only=False -> returns list
+            ("appium_find_element", ("id=foo",), [el]),
+            ("appium_get_element_attribute", ("id=foo", "name"), "default_mock"),
+            ("appium_get_element_attributes", ("id=foo", "name"), ["default_mock"]),
+            ("appium_get_element_attributes_in_element", ("parent", "child", "name"), ["default_mock"]),
+            ("get_element_attribute", ("id=foo", "name"), "default_mock"),
+            ("get_element_location", ("id=foo",), {'x': 0, 'y': 0}),
+            ("get_element_size", ("id=foo",), {'width': 100, 'height': 100}),
+            ("get_element_rect", ("id=foo",), {'x': 0, 'y': 0, 'width': 100, 'height': 100}),
+        ]
+        for method, args, expected in cases:
+            with self.subTest(method=method):
+                self.assertEqual(getattr(self.ek, method)(*args), expected)
 
     def test_appium_get_element_fail_required(self):
-        self.ek._element_finder.find.return_value = []
+        self.ek._element_finder.result = []
         with self.assertRaises(Exception):
             self.ek.appium_get_element("id=fail", timeout="0.1s", required=True)
 
     def test_appium_get_elements(self):
-        self.ek._element_finder.find.return_value = [self.mock_element, self.mock_element]
+        self.ek._element_finder.result = [self.mock_element, self.mock_element]
         elements = self.ek.appium_get_elements("id=list")
         self.assertEqual(len(elements), 2)
 
@@ -147,7 +209,7 @@ class TestElementKeywordsMock(unittest.TestCase):
         self.ek.page_should_contain_element("id=exist")
 
     def test_page_should_not_contain_element(self):
-        self.ek._element_finder.find.return_value = []
+        self.ek._element_finder.result = []
         self.ek.page_should_not_contain_element("id=missing")
 
     def test_element_should_be_visible(self):
@@ -169,53 +231,20 @@ class TestElementKeywordsMock(unittest.TestCase):
     # 5. TEST OTHER GET KEYWORDS
     # ====================================================================
 
-    def test_appium_get_button_element(self):
-        # Allow generic match
-        self.assertEqual(self.ek.appium_get_button_element("mock_text"), self.mock_element)
-
     def test_appium_get_element_text(self):
         self.mock_element._text = "Found Text"
         self.assertEqual(self.ek.appium_get_element_text("Found Text"), self.mock_element)
 
-    def test_appium_get_element_by(self):
-        self.assertEqual(self.ek.appium_get_element_by("name", "val"), self.mock_element)
-
-    def test_appium_get_element_in_element(self):
-        self.assertEqual(self.ek.appium_get_element_in_element("parent", "child"), self.mock_element)
-
     def test_appium_get_elements_in_element(self):
-        self.ek._element_finder.find.return_value = [self.mock_element, self.mock_element]
+        self.ek._element_finder.result = [self.mock_element, self.mock_element]
         elements = self.ek.appium_get_elements_in_element("parent", "child")
         self.assertEqual(len(elements), 2)
         
-    def test_appium_find_element(self):
-         # Default first_only=False -> returns list
-         self.assertEqual(self.ek.appium_find_element("id=foo"), [self.mock_element])
-
-    def test_appium_get_element_attribute(self):
-        # Update assertion to match setUp's default_mock name or override it
-        attr = self.ek.appium_get_element_attribute("id=foo", "name")
-        self.assertEqual(attr, "default_mock") 
-        
-    def test_appium_get_element_attributes(self):
-        # returns list
-        self.ek._element_finder.find.return_value = [self.mock_element]
-        attrs = self.ek.appium_get_element_attributes("id=foo", "name")
-        self.assertEqual(attrs, ["default_mock"])
-
-    def test_appium_get_element_attributes_in_element(self):
-        self.ek._element_finder.find.return_value = [self.mock_element]
-        attrs = self.ek.appium_get_element_attributes_in_element("parent", "child", "name")
-        self.assertEqual(attrs, ["default_mock"])
-        
     def test_appium_get_text(self):
         self.mock_element._text = "XYZ"
         text = self.ek.appium_get_text("id=foo")
         self.assertEqual(text, "XYZ")
 
-    def test_get_webelement(self):
-        self.assertEqual(self.ek.get_webelement("id=foo"), self.mock_element)
-    
     def test_get_webelement_in_webelement(self):
         # For this to work, we need to handle the fact that it might call methods on the 'element' arg
         # or use _element_finder with a special context.
@@ -223,30 +252,15 @@ class TestElementKeywordsMock(unittest.TestCase):
         pass 
         
     def test_get_webelements(self):
-        self.ek._element_finder.find.return_value = [self.mock_element]
+        self.ek._element_finder.result = [self.mock_element]
         self.assertEqual(len(self.ek.get_webelements("id=foo")), 1)
 
-    def test_get_element_attribute(self):
-         self.assertEqual(self.ek.get_element_attribute("id=foo", "name"), "default_mock")
-
-    def test_get_element_location(self):
-        loc = self.ek.get_element_location("id=foo")
-        self.assertEqual(loc, {'x': 0, 'y': 0})
-
-    def test_get_element_size(self):
-        size = self.ek.get_element_size("id=foo")
-        self.assertEqual(size, {'width': 100, 'height': 100})
-
-    def test_get_element_rect(self):
-        rect = self.ek.get_element_rect("id=foo")
-        self.assertEqual(rect, {'x': 0, 'y': 0, 'width': 100, 'height': 100})
-        
     def test_get_text(self):
          self.mock_element._text = "Simple Get Text"
          self.assertEqual(self.ek.get_text("id=foo"), "Simple Get Text")
     
     def test_get_matching_xpath_count(self):
-        self.ek._element_finder.find.return_value = [self.mock_element, self.mock_element]
+        self.ek._element_finder.result = [self.mock_element, self.mock_element]
         # It returns string in some implementations, let's allow either or check exact type if we knew
         # Robot libraries often return strings.
         self.assertEqual(str(self.ek.get_matching_xpath_count("//div")), "2")
@@ -269,7 +283,7 @@ class TestElementKeywordsMock(unittest.TestCase):
         self.ek.appium_click_if_exist("id=foo")
         
     def test_appium_click_if_exist_false(self):
-        self.ek._element_finder.find.return_value = []
+        self.ek._element_finder.result = []
         self.ek.appium_click_if_exist("id=fail")
 
     def test_appium_input_text_exact(self):
@@ -302,7 +316,8 @@ class TestElementKeywordsMock(unittest.TestCase):
         # Or _current_application().switch_to.active_element
         mock_driver = MagicMock()
         mock_driver.switch_to.active_element = self.mock_element
-        self.ek._current_application.return_value = mock_driver
+        self.ek._current_application = lambda: mock_driver
+        self.addCleanup(setattr, self.ek, "_current_application", lambda: self.mock_app)
         self.ek.input_text_into_current_element("text")
 
     def test_input_password(self):
@@ -314,7 +329,7 @@ class TestElementKeywordsMock(unittest.TestCase):
     def test_hide_keyboard(self):
         # Calls driver.hide_keyboard()
         self.ek.hide_keyboard()
-        self.ek._current_application.return_value.hide_keyboard.assert_called()
+        self.mock_app.hide_keyboard.assert_called()
 
     # ====================================================================
     # 7. TEST OTHER ASSERT KEYWORDS
@@ -322,7 +337,7 @@ class TestElementKeywordsMock(unittest.TestCase):
 
     def test_is_keyboard_shown(self):
         self.ek.is_keyboard_shown()
-        self.ek._current_application.return_value.is_keyboard_shown.assert_called()
+        self.mock_app.is_keyboard_shown.assert_called()
 
     def test_page_should_contain_text(self):
         # Mocks page source
@@ -366,7 +381,7 @@ class TestElementKeywordsMock(unittest.TestCase):
         self.ek.text_should_be_visible("Hello")
 
     def test_xpath_should_match_x_times(self):
-        self.ek._element_finder.find.return_value = [self.mock_element]
+        self.ek._element_finder.result = [self.mock_element]
         self.ek.xpath_should_match_x_times("//div", 1)
 
     # ====================================================================
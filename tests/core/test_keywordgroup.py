@@ -1,7 +1,11 @@
+import typing
 import unittest
 from AppiumLibrary.keywords.keywordgroup import KeywordGroup, ignore_on_fail
 
 class MockKeywordGroup(KeywordGroup):
+    # Only drops the instance __dict__ because KeywordGroup declares __slots__ = ()
+    __slots__ = ("_run_on_failure_count",)
+
     def __init__(self):
         self._run_on_failure_count = 0
     
@@ -25,6 +29,9 @@ class MockKeywordGroup(KeywordGroup):
     def nested_failing_keyword(self):
         self.failing_keyword()
 
+    def typed_keyword(self, flag: bool, count: int, items: list) -> str:
+        return "typed"
+
 class TestKeywordGroup(unittest.TestCase):
     
     def setUp(self):
@@ -73,5 +80,20 @@ class TestKeywordGroup(unittest.TestCase):
         # Since we invoked original, the wrapper wasn't executed, so no count increment
         self.assertEqual(self.kw_group._run_on_failure_count, 0)
 
+    def test_invoke_original_by_name(self):
+        """Verify _invoke_original_by_name calls the undecorated method"""
+        self.assertEqual(self.kw_group._invoke_original_by_name("successful_keyword"), "Success")
+        self.assertIsNone(self.kw_group._invoke_original_by_name("missing_keyword"))
+
+        with self.assertRaises(ValueError):
+            self.kw_group._invoke_original_by_name("failing_keyword")
+        self.assertEqual(self.kw_group._run_on_failure_count, 0)
+
+    def test_wrapped_keyword_keeps_type_hints(self):
+        """Verify wrapped keywords expose the original type hints (used by Robot argument conversion)"""
+        wrapped = MockKeywordGroup.typed_keyword
+        self.assertTrue(hasattr(wrapped, "__wrapped__"))
+        self.assertEqual(typing.get_type_hints(wrapped), typing.get_type_hints(wrapped.__wrapped__))
+
 if __name__ == '__main__':
     unittest.main()
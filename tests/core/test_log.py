@@ -1,38 +1,54 @@
 import inspect
+import io
+import itertools
+import sys
+import types
+
+# Per-function metadata (method_name, arg_names, varargs_name, keywords_name),
+# keyed by the caller's code object
+_META_CACHE: dict[types.CodeType, tuple[str, tuple, str | None, str | None]] = {}
+
 
 class TestLog:
-    def _log_activation(self):
+    __slots__ = ()
+
+    # Output sink used by test_log; None writes straight to sys.stdout
+    sink = None
+
+    def _log_activation(self, _sink=None):
         """Auto-log the calling method's name and arguments."""
         frame = inspect.currentframe().f_back
-        method_name = frame.f_code.co_name.replace('_', ' ').title()
-        arg_names, varargs_name, keywords_name, local_vars = inspect.getargvalues(frame)
-        
-        args_list = []
-        
-        # explicit args
-        for arg in arg_names:
-            if arg != 'self':
-                args_list.append(f"{arg}='{local_vars[arg]}'")
-        
-        # *args
-        if varargs_name:
-            varargs = local_vars[varargs_name]
-            for arg in varargs:
-                args_list.append(f"'{arg}'")
-        
-        # **kwargs
-        if keywords_name:
-            keywords = local_vars[keywords_name]
-            for key, value in keywords.items():
-                args_list.append(f"{key}='{value}'")
-
-        arg_str = ", ".join(args_list)
-        print(f"{method_name} {arg_str}")
+        code = frame.f_code
+        meta = _META_CACHE.get(code)
+        if meta is None:
+            varnames = code.co_varnames
+            argcount = code.co_argcount + code.co_kwonlyargcount
+            varargs_name = varnames[argcount] if code.co_flags & inspect.CO_VARARGS else None
+            if code.co_flags & inspect.CO_VARKEYWORDS:
+                keywords_name = varnames[argcount + (varargs_name is not None)]
+            else:
+                keywords_name = None
+            method_name = code.co_name.replace('_', ' ').title()
+            meta = _META_CACHE[code] = (method_name, varnames[:argcount], varargs_name, keywords_name)
+        method_name, arg_names, varargs_name, keywords_name = meta
+        local_vars = frame.f_locals
+
+        arg_str = ", ".join(itertools.chain(
+            # explicit args
+            (f"{arg}={local_vars[arg]!r}" for arg in arg_names if arg != 'self'),
+            # *args
+            (f"{arg!r}" for arg in local_vars.get(varargs_name) or ()),
+            # **kwargs
+            (f"{key}={value!r}" for key, value in (local_vars.get(keywords_name) or {}).items()),
+        ))
+        (_sink or sys.stdout.write)(f"{method_name} {arg_str}\n")
 
     def test_log(self, locator, timeout=None, reference=None, *args, **kwargs):
-        self._log_activation()
+        self._log_activation(self.sink)
 
 if __name__ == "__main__":
+    buf = io.StringIO()
+    TestLog.sink = sink = buf.write
     test_log = TestLog()
     test_log.test_log("locator", "timeout", "reference", "arg1", "arg2", key1="value1", key2="value2")
     test_log.test_log(locator="//Button", timeout="10", reference="reference", arg1="arg1", arg2="arg2", key1="value1", key2="value2", key3="value3")
@@ -40,16 +56,18 @@ if __name__ == "__main__":
     test_log.test_log("//Button", reference="reference")
     
     # Additional tests
-    print("-" * 20)
-    print("Testing positional args only:")
+    sink("-" * 20 + "\n")
+    sink("Testing positional args only:\n")
     test_log.test_log("param1", "10s", "ref1")
     
-    print("Testing mixed positional and kwargs:")
+    sink("Testing mixed positional and kwargs:\n")
     test_log.test_log("param1", timeout="20s", extra_param="extra")
     
-    print("Testing varargs:")
+    sink("Testing varargs:\n")
     test_log.test_log("param1", None, None, "vararg1", "vararg2")
     
-    print("Testing structure with special chars:")
+    sink("Testing structure with special chars:\n")
     test_log.test_log("xpath=//div[@id='foo']", handle_error=True)
 
+    sys.stdout.write(buf.getvalue())
+
@@ -7,7 +7,7 @@ from unittest.mock import patch, MagicMock
 
 # Mock dependencies that are not installed in this environment
 # We need to mock specific submodules so that 'from robot.foo import Bar' works
-mocks = [
+_MOCKS = (
     'robot',
     'robot.utils',
     'robot.libraries',
@@ -28,21 +28,26 @@ mocks = [
     'selenium.webdriver.common.keys',
     'selenium.webdriver.remote',
     'selenium.webdriver.remote.webelement',
-]
-
-for m in mocks:
-    sys.modules[m] = MagicMock()
-
-# Ensure nested access works (e.g. robot.utils)
-sys.modules['robot'].utils = sys.modules['robot.utils']
-sys.modules['robot'].libraries = sys.modules['robot.libraries']
-sys.modules['robot.libraries'].BuiltIn = sys.modules['robot.libraries.BuiltIn']
-sys.modules['selenium'].common = sys.modules['selenium.common']
-sys.modules['selenium'].webdriver = sys.modules['selenium.webdriver']
-sys.modules['selenium.webdriver'].remote = sys.modules['selenium.webdriver.remote']
-sys.modules['appium'].webdriver = sys.modules['appium.webdriver']
-sys.modules['appium'].webdriver.common = sys.modules['appium.webdriver.common']
-sys.modules['appium'].webdriver.mobilecommand = sys.modules['appium.webdriver.mobilecommand']
+)
+
+sys.modules.update({m: MagicMock() for m in _MOCKS})
+
+# Ensure nested access works (e.g. robot.utils): (parent, attribute, child)
+_LINKS = (
+    ('robot', 'utils', 'robot.utils'),
+    ('robot', 'libraries', 'robot.libraries'),
+    ('robot.libraries', 'BuiltIn', 'robot.libraries.BuiltIn'),
+    ('selenium', 'common', 'selenium.common'),
+    ('selenium', 'webdriver', 'selenium.webdriver'),
+    ('selenium.webdriver', 'remote', 'selenium.webdriver.remote'),
+    ('appium', 'webdriver', 'appium.webdriver'),
+    ('appium.webdriver', 'common', 'appium.webdriver.common'),
+    ('appium.webdriver', 'mobilecommand', 'appium.webdriver.mobilecommand'),
+)
+
+for parent, attr, child in _LINKS:
+    if parent in sys.modules:
+        setattr(sys.modules[parent], attr, sys.modules[child])
 
 # Adjust path to allow importing AppiumLibrary
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -176,5 +181,12 @@ class TestWindowsPathNormalization(unittest.TestCase):
         result = self.keywords.appium_normalize_path(path, sep="\\")
         self.assertEqual(result, r"C:\Users\Public\Downloads")
 
+    def test_24_pure_path_input(self):
+        """Should accept any path-like object, not only pathlib.Path"""
+        result = self.keywords.appium_normalize_path(pathlib.PureWindowsPath("C:/x/y"), sep="\\")
+        self.assertEqual(result, "C:\\x\\y")
+        result = self.keywords.appium_normalize_path(pathlib.PurePosixPath("/usr//bin"), sep="/")
+        self.assertEqual(result, "/usr/bin")
+
 if __name__ == "__main__":
     unittest.main()
@@ -5,13 +5,36 @@ import os
 sys.path.append(os.getcwd())
 from unittest.mock import MagicMock, patch, call
 from AppiumLibrary.keywords._table import _TableKeywords
-from selenium.webdriver.remote.webelement import WebElement
-import appium.webdriver.webdriver
+
+
+_TABLE = (
+    ("Name", "Size", "Status"),
+    ("file1.txt", "1KB", "Active"),
+    ("file2.txt", "2KB", "Inactive"),
+    ("file3.txt", "3KB", "Active"),
+)
+
+
+class _Element:
+    """Lightweight element stand-in whose ``get_attribute`` returns ``value``."""
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def get_attribute(self, *args):
+        return self.value
 
 
 class TestTableKeywords(unittest.TestCase):
     """Unit tests for _TableKeywords."""
 
+    @classmethod
+    def setUpClass(cls):
+        # The mock table is never mutated by the tests, so build it once
+        cls._build_mock_table()
+        cls.mock_driver = MagicMock()
+
     def setUp(self):
         self.builtin_patcher = patch('AppiumLibrary.keywords._element.BuiltIn')
         self.mock_builtin_class = self.builtin_patcher.start()
@@ -31,70 +54,37 @@ class TestTableKeywords(unittest.TestCase):
         self.tk._warn = MagicMock()
 
         # Mock driver
-        self.mock_driver = MagicMock()
+        self.mock_driver.reset_mock()
         self.tk._current_application = MagicMock(return_value=self.mock_driver)
 
-        # Build mock table structure
-        self._build_mock_table()
+        # Pre-built table data for methods that accept table_data
+        self.sample_table_data = [list(row) for row in _TABLE]
 
-    def _build_mock_table(self):
+    @classmethod
+    def _build_mock_table(cls):
         """Create mock elements simulating a table with headers and rows."""
         # Table element
-        self.mock_table = MagicMock()
-
-        # Header items
-        self.mock_header1 = MagicMock()
-        self.mock_header1.get_attribute.return_value = "Name"
-        self.mock_header2 = MagicMock()
-        self.mock_header2.get_attribute.return_value = "Size"
-        self.mock_header3 = MagicMock()
-        self.mock_header3.get_attribute.return_value = "Status"
+        cls.mock_table = MagicMock()
 
         # Row elements
-        self.mock_row1 = MagicMock()
-        self.mock_row2 = MagicMock()
-        self.mock_row3 = MagicMock()
+        cls.mock_row1 = MagicMock()
+        cls.mock_row2 = MagicMock()
+        cls.mock_row3 = MagicMock()
 
-        # Cell elements for rows
-        self.mock_cell1_1 = MagicMock()
-        self.mock_cell1_1.get_attribute.return_value = "file1.txt"
-        self.mock_cell1_2 = MagicMock()
-        self.mock_cell1_2.get_attribute.return_value = "1KB"
-        self.mock_cell1_3 = MagicMock()
-        self.mock_cell1_3.get_attribute.return_value = "Active"
-
-        self.mock_cell2_1 = MagicMock()
-        self.mock_cell2_1.get_attribute.return_value = "file2.txt"
-        self.mock_cell2_2 = MagicMock()
-        self.mock_cell2_2.get_attribute.return_value = "2KB"
-        self.mock_cell2_3 = MagicMock()
-        self.mock_cell2_3.get_attribute.return_value = "Inactive"
-
-        self.mock_cell3_1 = MagicMock()
-        self.mock_cell3_1.get_attribute.return_value = "file3.txt"
-        self.mock_cell3_2 = MagicMock()
-        self.mock_cell3_2.get_attribute.return_value = "3KB"
-        self.mock_cell3_3 = MagicMock()
-        self.mock_cell3_3.get_attribute.return_value = "Active"
+        # Header items
+        cls.mock_header1, cls.mock_header2, cls.mock_header3 = map(_Element, _TABLE[0])
 
-        # Pre-built table data for methods that accept table_data
-        self.sample_table_data = [
-            ["Name", "Size", "Status"],
-            ["file1.txt", "1KB", "Active"],
-            ["file2.txt", "2KB", "Inactive"],
-            ["file3.txt", "3KB", "Active"],
-        ]
+        # Cell elements for rows
+        cls.mock_cell1_1, cls.mock_cell1_2, cls.mock_cell1_3 = map(_Element, _TABLE[1])
+        cls.mock_cell2_1, cls.mock_cell2_2, cls.mock_cell2_3 = map(_Element, _TABLE[2])
+        cls.mock_cell3_1, cls.mock_cell3_2, cls.mock_cell3_3 = map(_Element, _TABLE[3])
 
     def _setup_table_finding(self):
         """Configure mocks so get_table_data returns the sample table."""
         self.tk.appium_get_element = MagicMock(return_value=self.mock_table)
         self.tk.appium_get_element_attributes_in_element = MagicMock(
-            side_effect=[
-                ["Name", "Size", "Status"],       # headers
-                ["file1.txt", "1KB", "Active"],    # row 1
-                ["file2.txt", "2KB", "Inactive"],  # row 2
-                ["file3.txt", "3KB", "Active"],    # row 3
-            ]
+            # headers, then rows 1-3
+            side_effect=map(list, _TABLE)
         )
         self.tk.appium_get_elements_in_element = MagicMock(
             return_value=[self.mock_row1, self.mock_row2, self.mock_row3]
@@ -139,10 +129,10 @@ class TestTableKeywords(unittest.TestCase):
             return_value=[self.mock_row1, self.mock_row2]
         )
         self.tk.appium_get_element_attributes_in_element = MagicMock(
-            side_effect=[
+            side_effect=iter([
                 ["file1.txt", "1KB", "Active"],
                 ["file2.txt", "2KB", "Inactive"],
-            ]
+            ])
         )
         result = self.tk.get_table_rows("//Table", "//ListItem", "//Text", "Name")
         self.assertEqual(len(result), 2)
@@ -218,6 +208,21 @@ class TestTableKeywords(unittest.TestCase):
         self.assertEqual(result[0], ["file1.txt", "1KB", "Active"])
         self.assertEqual(result[1], ["file3.txt", "3KB", "Active"])
 
+    def test_find_table_row_by_value_after_rows_added(self):
+        table_data = [list(row) for row in self.sample_table_data]
+        self.assertIsNone(self.tk.find_table_row_by_value("Name", "file4.txt", table_data=table_data))
+        table_data.append(["file4.txt", "4KB", "Active"])
+        result = self.tk.find_table_row_by_value("Name", "file4.txt", table_data=table_data)
+        self.assertEqual(result, ["file4.txt", "4KB", "Active"])
+
+    def test_find_table_row_by_value_after_cell_edit(self):
+        table_data = [list(row) for row in self.sample_table_data]
+        self.assertEqual(self.tk.find_table_row_by_value("Name", "file2.txt", table_data=table_data)[0], "file2.txt")
+        table_data[2][0] = "renamed.txt"
+        self.assertIsNone(self.tk.find_table_row_by_value("Name", "file2.txt", table_data=table_data))
+        result = self.tk.find_table_row_by_value("Name", "renamed.txt", table_data=table_data)
+        self.assertEqual(result, ["renamed.txt", "2KB", "Inactive"])
+
     def test_find_table_rows_by_multiple_values_and(self):
         result = self.tk.find_table_rows_by_multiple_values(
             {"Status": "Active", "Name": "file3.txt"},
@@ -280,6 +285,12 @@ class TestTableKeywords(unittest.TestCase):
         )
         self.assertTrue(result)
 
+    def test_verify_table_column_values_by_index(self):
+        result = self.tk.verify_table_column_values(
+            None, ["1KB", "3KB"], table_data=self.sample_table_data, col_index=1
+        )
+        self.assertTrue(result)
+
     def test_verify_table_column_values_ordered(self):
         result = self.tk.verify_table_column_values(
             "Name",
@@ -339,7 +350,7 @@ class TestTableKeywords(unittest.TestCase):
             return_value=[self.mock_row1, self.mock_row2, self.mock_row3]
         )
         result = self.tk.get_table_row_element(row_index=1, table_locator="//Table")
-        self.assertEqual(result, self.mock_row2)
+        self.assertIs(result, self.mock_row2)
 
     def test_get_table_row_element_by_index_out_of_bounds(self):
         self.tk.appium_get_element = MagicMock(return_value=self.mock_table)
@@ -353,7 +364,7 @@ class TestTableKeywords(unittest.TestCase):
         self.tk.get_table_row_element = MagicMock(return_value=self.mock_row1)
         self.tk.appium_click = MagicMock()
         result = self.tk.click_table_row(row_index=0, table_locator="//Table")
-        self.assertEqual(result, self.mock_row1)
+        self.assertIs(result, self.mock_row1)
         self.tk.appium_click.assert_called_once_with(self.mock_row1)
 
     def test_click_table_row_invalid_button(self):
@@ -364,14 +375,14 @@ class TestTableKeywords(unittest.TestCase):
         self.tk.get_table_row_element = MagicMock(return_value=self.mock_row1)
         self.tk.appium_action_context_click = MagicMock()
         result = self.tk.click_table_row(row_index=0, button="right", table_locator="//Table")
-        self.assertEqual(result, self.mock_row1)
+        self.assertIs(result, self.mock_row1)
         self.tk.appium_action_context_click.assert_called_once_with(self.mock_row1)
 
     def test_click_table_row_double(self):
         self.tk.get_table_row_element = MagicMock(return_value=self.mock_row1)
         self.tk.appium_action_double_click = MagicMock()
         result = self.tk.click_table_row(row_index=0, button="double", table_locator="//Table")
-        self.assertEqual(result, self.mock_row1)
+        self.assertIs(result, self.mock_row1)
         self.tk.appium_action_double_click.assert_called_once_with(self.mock_row1)
 
     def test_click_table_cell(self):
@@ -381,7 +392,7 @@ class TestTableKeywords(unittest.TestCase):
         )
         self.tk.appium_click = MagicMock()
         result = self.tk.click_table_cell(0, 1, table_locator="//Table")
-        self.assertEqual(result, self.mock_cell1_2)
+        self.assertIs(result, self.mock_cell1_2)
         self.tk.appium_click.assert_called_once_with(self.mock_cell1_2)
 
     def test_get_table_cell_element(self):
@@ -390,11 +401,11 @@ class TestTableKeywords(unittest.TestCase):
             return_value=[self.mock_cell1_1, self.mock_cell1_2]
         )
         result = self.tk.get_table_cell_element(0, 1, table_locator="//Table")
-        self.assertEqual(result, self.mock_cell1_2)
+        self.assertIs(result, self.mock_cell1_2)
 
     def test_select_table_rows(self):
         self.tk.get_table_row_element = MagicMock(
-            side_effect=[self.mock_row1, self.mock_row2]
+            side_effect=iter([self.mock_row1, self.mock_row2])
         )
         self.tk.appium_click = MagicMock()
         self.tk.appium_begin_action_chain = MagicMock()
@@ -1,6 +1,7 @@
 from AppiumLibrary import AppiumLibrary
 
 remote_url = "http://192.168.8.245:4723"
+last_list_item = '//List/ListItem[last()]'
 
 appium = AppiumLibrary()
 
@@ -9,9 +10,9 @@ appium.open_application(remote_url=remote_url,
                         platformName="Windows", 
                         automationName="NovaWindows2")
 
-appium.appium_scroll_into_view('//List/ListItem[last()]')
+appium.appium_scroll_into_view(last_list_item)
 
-appium.appium_press_page_down('//List/ListItem[last()]')
+appium.appium_press_page_down(last_list_item)
 
 appium.appium_ps_sendkeys('{PGDN}')
 